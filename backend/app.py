@@ -1,181 +1,397 @@
+import base64
+import orjson
 import os
-import psycopg2
+from contextlib import asynccontextmanager
+from cachetools import TTLCache
 from dotenv import load_dotenv
-from fastapi import FastAPI
-from pydantic import BaseModel
-from datetime import date
-from psycopg2.extras import Json
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+from psycopg import errors
+from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb, set_json_dumps, set_json_loads
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
 
 # Load environment variables from .env file
 load_dotenv()
-app = FastAPI()
+
+# Let psycopg encode/decode json/jsonb values (e.g. basic_info) with orjson.
+# OPT_NON_STR_KEYS keeps json.dumps' behaviour of turning e.g. {1: "x"} into {"1": "x"}.
+set_json_dumps(lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS))
+set_json_loads(orjson.loads)
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# Optional read replica (or PgBouncer in front of one) for read-only helpers
+DATABASE_URL_RO = os.getenv("DATABASE_URL_RO") or DATABASE_URL
 
 
-def get_connection():
-    return psycopg2.connect(DATABASE_URL)
+# Shared async connection pools, opened once at startup instead of connecting per call.
+# prepare_threshold=0 makes psycopg prepare each statement the first time a
+# connection runs it and reuse it by name afterwards, so the server skips re-parsing.
+POOL = AsyncConnectionPool(DATABASE_URL, min_size=4, max_size=32, open=False,
+                           kwargs={"prepare_threshold": 0})
+RO_POOL = POOL if DATABASE_URL_RO == DATABASE_URL else AsyncConnectionPool(
+    DATABASE_URL_RO, min_size=4, max_size=32, open=False, kwargs={"prepare_threshold": 0})
+# Streaming exports hold their connection for the whole client download, so they
+# get their own small pool and a few slow clients can't starve the API pools.
+EXPORT_POOL = AsyncConnectionPool(DATABASE_URL_RO, min_size=1, max_size=4, open=False, timeout=5)
 
 
-def get_all_members():
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("SELECT id, name FROM members ORDER BY created_at;")
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
-    return rows
+async def open_pool():
+    await POOL.open()
+    if RO_POOL is not POOL:
+        await RO_POOL.open()
+    await EXPORT_POOL.open()
 
 
-def get_member_id_by_name(name):
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("SELECT id FROM members WHERE name = %s", (name,))
-    row = cur.fetchone()
-    cur.close()
-    conn.close()
-    return row[0] if row else None
+async def close_pool():
+    await EXPORT_POOL.close()
+    if RO_POOL is not POOL:
+        await RO_POOL.close()
+    await POOL.close()
 
 
-def add_offering(member_id, amount, note=""):
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        INSERT INTO offerings (member_id, amount, note)
-        VALUES (%s, %s, %s)
-        RETURNING id, donated_at;
-        """,
-        (member_id, amount, note)
-    )
-    offering = cur.fetchone()
-    conn.commit()
-    cur.close()
-    conn.close()
-    return offering
+def conn_ctx():
+    """Lease a connection from the pool; commits on success, rolls back on error."""
+    return POOL.connection()
 
-# Example: get donation log
 
+def ro_conn_ctx():
+    """Lease a connection for read-only queries (the replica when DATABASE_URL_RO is set)."""
+    return RO_POOL.connection()
+
+
+# Short-lived caches for the read-mostly member lookups; cleared on member writes.
+# A read only stores its result if no clear happened while it was in flight
+# (tracked by MEMBER_CACHE_GENERATION), so it can't put pre-write data back.
+# Pages are read from RO_POOL, so with a lagging replica a page can still be up to
+# replica lag + 5 s stale after a write.
+MEMBER_ID_CACHE = TTLCache(maxsize=10000, ttl=30)
+MEMBERS_PAGE_CACHE = TTLCache(maxsize=256, ttl=5)
+MEMBER_CACHE_GENERATION = 0
+
+
+def clear_member_caches():
+    global MEMBER_CACHE_GENERATION
+    MEMBER_CACHE_GENERATION += 1
+    MEMBER_ID_CACHE.clear()
+    MEMBERS_PAGE_CACHE.clear()
+
+
+async def get_all_members(limit: int = 50,
+                          after_created_at: datetime | None = None,
+                          after_id: UUID | None = None):
+    """
+    One page of members in creation order, using keyset pagination.
+    Pass the created_at/id of the last row seen to get the next page.
+    Returns list of dicts: {id, name, created_at}
+    """
+    key = (limit, after_created_at, after_id)
+    try:
+        return MEMBERS_PAGE_CACHE[key]
+    except KeyError:
+        pass
+    generation = MEMBER_CACHE_GENERATION
+    async with ro_conn_ctx() as conn, conn.cursor(row_factory=dict_row) as cur:
+        if after_created_at is None:
+            await cur.execute(
+                "SELECT id, name, created_at FROM members ORDER BY created_at, id LIMIT %s;",
+                (limit,))
+        else:
+            await cur.execute(
+                """
+                SELECT id, name, created_at
+                FROM members
+                WHERE (created_at, id) > (%s, %s)
+                ORDER BY created_at, id
+                LIMIT %s;
+                """,
+                (after_created_at, after_id, limit))
+        members = await cur.fetchall()
+    if generation == MEMBER_CACHE_GENERATION:
+        MEMBERS_PAGE_CACHE[key] = members
+    return members
+
+
+async def search_members_by_name(term: str, limit: int = 20):
+    # Match the term literally: escape LIKE's wildcards (backslash is the default escape)
+    term = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    async with ro_conn_ctx() as conn, conn.cursor(row_factory=dict_row) as cur:
+        await cur.execute(
+            "SELECT id, name FROM members WHERE name ILIKE %s ORDER BY name LIMIT %s;",
+            (f"%{term}%", limit))
+        return await cur.fetchall()
+
+
+async def stream_json_array(name: str, query: str, params=(), itersize: int = 1000):
+    """
+    Run `query` on a server-side cursor and yield the rows as a JSON array,
+    one chunk per batch, so memory stays flat however many rows there are.
+    The query and first fetch happen before the first chunk is yielded.
+    """
+    async with EXPORT_POOL.connection() as conn, conn.cursor(name=name, row_factory=dict_row) as cur:
+        await cur.execute(query, params)
+        rows = await cur.fetchmany(itersize)
+        yield b"[" + b",".join(orjson.dumps(row) for row in rows)
+        while rows := await cur.fetchmany(itersize):
+            yield b"," + b",".join(orjson.dumps(row) for row in rows)
+        yield b"]"
+
+
+async def stream_json_response(chunks):
+    """
+    Wrap a stream_json_array generator in a StreamingResponse. The first chunk is
+    awaited here so database errors surface as a proper error status, not as a
+    200 with a truncated body.
+    """
+    try:
+        first = await anext(chunks)
+    except PoolTimeout:
+        raise HTTPException(status_code=503, detail="Too many exports in progress")
+
+    async def body():
+        yield first
+        async for chunk in chunks:
+            yield chunk
 
-def get_offerings_for_member(member_id):
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute(
+    return StreamingResponse(body(), media_type="application/json")
+
+
+def stream_members():
+    return stream_json_array(
+        "members_stream",
+        "SELECT id, name, created_at FROM members ORDER BY created_at, id;")
+
+
+def stream_offerings_for_member(member_id: UUID):
+    return stream_json_array(
+        "offerings_stream",
         """
-        SELECT id, amount, currency, donated_at, note
+        SELECT id, amount::float8 AS amount, currency, donated_at, note
         FROM offerings
         WHERE member_id = %s
-        ORDER BY donated_at DESC;
+        ORDER BY donated_at DESC, id DESC;
         """,
-        (member_id,)
-    )
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
-    return rows
+        (member_id,))
 
 
-def delete_member(member_id: str):
-    conn = get_connection()
-    cur = conn.cursor()
+async def get_member_id_by_name(name):
     try:
-        # Delete related offerings first
-        cur.execute("DELETE FROM offerings WHERE member_id = %s", (member_id,))
+        return MEMBER_ID_CACHE[name]
+    except KeyError:
+        pass
+    generation = MEMBER_CACHE_GENERATION
+    # Primary, not the replica: a member that was just created must be found
+    async with conn_ctx() as conn, conn.cursor() as cur:
+        await cur.execute("SELECT id FROM members WHERE name = %s", (name,))
+        row = await cur.fetchone()
+    if not row:
+        return None  # misses aren't cached, so a new member shows up right away
+    if generation == MEMBER_CACHE_GENERATION:
+        MEMBER_ID_CACHE[name] = row[0]
+    return row[0]
+
+
+async def add_offering(member_id: UUID, amount, note=""):
+    async with conn_ctx() as conn, conn.cursor() as cur:
+        await cur.execute(
+            """
+            INSERT INTO offerings (member_id, amount, note)
+            VALUES (%s, %s, %s)
+            RETURNING id, donated_at;
+            """,
+            (member_id, amount, note)
+        )
+        return await cur.fetchone()
 
-        # Then delete the member
-        cur.execute("DELETE FROM members WHERE id = %s", (member_id,))
 
-        conn.commit()
-    except Exception as e:
-        conn.rollback()
-        print("Error deleting member:", e)
-    finally:
-        cur.close()
-        conn.close()
-        print("delete done")
-
-
-def create_member(name: str,
-                  level_code: str,
-                  status_code: str,
-                  *,
-                  gender: str | None = None,
-                  birthdate: date | None = None,
-                  phone: str | None = None,
-                  email: str | None = None,
-                  basic_info: dict | None = None):
+async def add_offerings_bulk(rows):
     """
-    Insert a member using codes from the lookup tables.
-    Returns tuple: (id, name, membership_level_id, interview_status_id)
+    Insert many offerings in one go.
+    rows: iterable of (member_id, amount, note, donated_at); donated_at may be None.
+    Returns list of tuples: (id, amount, currency, donated_at, note)
     """
+    async with conn_ctx() as conn, conn.cursor() as cur:
+        # psycopg sends every row in pipeline mode with a single Sync at the end
+        await cur.executemany(
+            """
+            INSERT INTO offerings (member_id, amount, note, donated_at)
+            VALUES (%s, %s, %s, COALESCE(%s, now()))
+            RETURNING id, amount::float8 AS amount, currency, donated_at, note;
+            """,
+            rows,
+            returning=True
+        )
+        inserted = []
+        while True:
+            inserted.append(await cur.fetchone())
+            if not cur.nextset():
+                break
+        return inserted
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
-        # --- Resolve membership level code -> id
-        cur.execute(
-            "SELECT id FROM membership_levels WHERE code = %s", (level_code,))
-        row = cur.fetchone()
-        if not row:
-            raise ValueError(f"Unknown membership level code: {level_code!r}")
-        membership_level_id = row[0]
-
-        # --- Resolve interview status code -> id
-        cur.execute(
-            "SELECT id FROM interview_statuses WHERE code = %s", (status_code,))
-        row = cur.fetchone()
-        if not row:
-            raise ValueError(f"Unknown interview status code: {status_code!r}")
-        interview_status_id = row[0]
-
-        # --- Insert member
-        cur.execute(
+# Example: get donation log
+
+
+async def get_offering_total(member_id: UUID):
+    async with ro_conn_ctx() as conn, conn.cursor() as cur:
+        await cur.execute(
+            "SELECT COALESCE(SUM(amount), 0)::float8 FROM offerings WHERE member_id = %s",
+            (member_id,)
+        )
+        return (await cur.fetchone())[0]
+
+
+async def get_offering_summary(member_id: UUID, limit: int = 50, offset: int = 0):
+    """
+    Donation total plus a page of the log in one round-trip.
+    The sum is computed by Postgres over all offerings, and the JSON is built server-side.
+    Returns the JSON text of {"total": ..., "log": [...]}
+    """
+    async with ro_conn_ctx() as conn, conn.cursor() as cur:
+        await cur.execute(
             """
-            INSERT INTO members
-              (name, membership_level_id, interview_status_id, gender, birthdate, phone, email, basic_info)
-            VALUES
-              (%s,   %s,                   %s,                  %s,     %s,        %s,    %s,    %s)
-            RETURNING id, name, membership_level_id, interview_status_id;
+            SELECT jsonb_build_object(
+              'total', (SELECT COALESCE(SUM(amount), 0)::float8 FROM offerings WHERE member_id = %(member_id)s),
+              'log', COALESCE(
+                (SELECT jsonb_agg(t ORDER BY t.donated_at DESC, t.id DESC)
+                 FROM (SELECT id, amount::float8 AS amount, currency, donated_at, note
+                       FROM offerings
+                       WHERE member_id = %(member_id)s
+                       ORDER BY donated_at DESC, id DESC
+                       LIMIT %(limit)s OFFSET %(offset)s) AS t),
+                '[]'::jsonb)
+            )::text;
             """,
-            (name, membership_level_id, interview_status_id, gender, birthdate, phone,
-             email, psycopg2.extras.Json(basic_info) if basic_info is not None else None)
+            {"member_id": member_id, "limit": limit, "offset": offset}
         )
-        new_member = cur.fetchone()  # (id, name, membership_level_id, interview_status_id)
-        conn.commit()
-        return new_member
-
-    except Exception as e:
-        conn.rollback()
-        print("Error creating member:", e)
-        return None
-    finally:
-        cur.close()
-        conn.close()
-
-
-if __name__ == "__main__":
-    print("Members:", get_all_members())  # testing get all
-    print("ID: ", get_member_id_by_name("王小明"))  # testing search funciton
-    # delete_member("8552b3f4-c2fd-4af4-b7c9-cd9fb197c079") # testing delete which will
-    # testing the create
-    result = create_member(
-        name="王明",
-        level_code="participant",
-        status_code="undecided",
-        gender="M",
-        phone="555-1234",
-        basic_info={"city": "Bellevue"}
-    )
-
-    if result:
-        member_id, member_name, level_id, status_id = result
-        print("Created:", member_id, member_name, level_id, status_id)
-        # Test donation (replace with a real UUID from your members table)
-        # offering = add_offering("8bc9f775-a66a-47ea-bfdf-13fa3373a125", 1000, "測試奉獻")
-        # print("Added offering:", offering)
-        # print("Offerings:", get_offerings_for_member("8bc9f775-a66a-47ea-bfdf-13fa3373a125"))
-
-# ---- Request body schema for creating a member ----
+        return (await cur.fetchone())[0]
+
+
+async def delete_member(member_id: UUID):
+    """Delete a member; returns the number of members deleted (0 or 1)."""
+    # The pooled connection commits on success and rolls back on error
+    async with conn_ctx() as conn, conn.cursor() as cur:
+        # Related offerings go with it via ON DELETE CASCADE
+        # (see migrations/001_offerings_member_cascade.sql)
+        await cur.execute("DELETE FROM members WHERE id = %s", (member_id,))
+        deleted = cur.rowcount
+    clear_member_caches()
+    return deleted
+
+
+# Lookup code -> id caches for the (essentially static) reference tables
+LEVELS: dict = {}
+STATUSES: dict = {}
+
+
+async def reload_lookups():
+    # Read from the primary, since create_member writes these ids there
+    async with conn_ctx() as conn, conn.cursor() as cur:
+        await cur.execute("SELECT code, id FROM membership_levels;")
+        levels = dict(await cur.fetchall())
+        await cur.execute("SELECT code, id FROM interview_statuses;")
+        statuses = dict(await cur.fetchall())
+    LEVELS.clear()
+    LEVELS.update(levels)
+    STATUSES.clear()
+    STATUSES.update(statuses)
+
+
+async def create_member(name: str,
+                        level_code: str,
+                        status_code: str,
+                        *,
+                        gender: str | None = None,
+                        birthdate: date | None = None,
+                        phone: str | None = None,
+                        email: str | None = None,
+                        basic_info: dict | None = None):
+    """
+    Insert a member using codes from the lookup tables.
+    Returns tuple: (id, name, membership_level_id, interview_status_id)
+    Raises ValueError for an unknown membership level or interview status code.
+    """
+
+    params = {
+        "level_code": level_code,
+        "status_code": status_code,
+        "name": name,
+        "gender": gender,
+        "birthdate": birthdate,
+        "phone": phone,
+        "email": email,
+        "basic_info": Jsonb(basic_info) if basic_info is not None else None,
+        "level_id": LEVELS.get(level_code),
+        "status_id": STATUSES.get(status_code),
+    }
+    try:
+        # One transaction: committed when the pooled connection is returned,
+        # rolled back if anything (including an unknown code) raises
+        async with conn_ctx() as conn, conn.cursor() as cur:
+            if params["level_id"] is not None and params["status_id"] is not None:
+                # Both codes are cached, so insert the ids directly
+                await cur.execute(
+                    """
+                    INSERT INTO members
+                      (name, membership_level_id, interview_status_id, gender, birthdate, phone, email, basic_info)
+                    VALUES
+                      (%(name)s, %(level_id)s, %(status_id)s, %(gender)s, %(birthdate)s, %(phone)s, %(email)s, %(basic_info)s)
+                    RETURNING id, name, membership_level_id, interview_status_id;
+                    """,
+                    params
+                )
+                new_member = await cur.fetchone()
+            else:
+                # Resolve both lookup codes and insert in a single round-trip. The
+                # insert only fires when both codes exist; the trailing flags tell
+                # us which one was missing otherwise.
+                await cur.execute(
+                    """
+                    WITH lvl AS (SELECT id FROM membership_levels WHERE code = %(level_code)s),
+                         sts AS (SELECT id FROM interview_statuses WHERE code = %(status_code)s),
+                         ins AS (
+                           INSERT INTO members
+                             (name, membership_level_id, interview_status_id, gender, birthdate, phone, email, basic_info)
+                           SELECT %(name)s, lvl.id, sts.id, %(gender)s, %(birthdate)s, %(phone)s, %(email)s, %(basic_info)s
+                           FROM lvl, sts
+                           RETURNING id, name, membership_level_id, interview_status_id
+                         )
+                    SELECT ins.id, ins.name, ins.membership_level_id, ins.interview_status_id,
+                           EXISTS (SELECT 1 FROM lvl), EXISTS (SELECT 1 FROM sts)
+                    FROM (SELECT 1) AS one LEFT JOIN ins ON true;
+                    """,
+                    params
+                )
+                row = await cur.fetchone()
+                level_found, status_found = row[4], row[5]
+                if not level_found:
+                    raise ValueError(f"Unknown membership level code: {level_code!r}")
+                if not status_found:
+                    raise ValueError(f"Unknown interview status code: {status_code!r}")
+
+                # Remember the codes we just resolved for the next call
+                LEVELS[level_code] = row[2]
+                STATUSES[status_code] = row[3]
+                new_member = row[:4]
+    except errors.ForeignKeyViolation:
+        if params["level_id"] is None or params["status_id"] is None:
+            raise
+        # A cached lookup id is stale (e.g. the reference row was re-created):
+        # forget both codes and retry, which resolves them by code instead
+        LEVELS.pop(level_code, None)
+        STATUSES.pop(status_code, None)
+        return await create_member(name, level_code, status_code, gender=gender,
+                                   birthdate=birthdate, phone=phone, email=email,
+                                   basic_info=basic_info)
+
+    clear_member_caches()
+    return new_member  # (id, name, membership_level_id, interview_status_id)
+
+
+# ---- Request body schemas ----
 
 
 class MemberCreate(BaseModel):
@@ -183,26 +399,134 @@ class MemberCreate(BaseModel):
     membership_level: str
     interview_status: str
 
+
+MAX_BULK_OFFERINGS = 1000
+
+
+class OfferingCreate(BaseModel):
+    member_id: UUID
+    amount: Decimal = Field(gt=0, allow_inf_nan=False)
+    note: str = ""
+    donated_at: datetime | None = None
+
 # ---- API endpoints ----
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pools live for exactly the lifetime of the app
+    await open_pool()
+    try:
+        await reload_lookups()
+        yield
+    finally:
+        await close_pool()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+def json_response(content) -> Response:
+    """Encode with orjson directly, skipping FastAPI's per-field jsonable_encoder pass."""
+    return Response(orjson.dumps(content), media_type="application/json")
+
+
+def encode_cursor(created_at: datetime, member_id: UUID) -> str:
+    """URL-safe base64 of "<created_at iso>,<id>", so it can go in a query string as-is."""
+    raw = f"{created_at.isoformat()},{member_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Inverse of encode_cursor; raises ValueError for anything malformed."""
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    created_at, member_id = raw.split(",", 1)
+    return datetime.fromisoformat(created_at), UUID(member_id)
+
+
 @app.get("/members")
-def api_get_members():
-    return get_all_members()
+async def api_get_members(limit: int = Query(50, ge=1, le=500), cursor: str | None = None):
+    after_created_at = after_id = None
+    if cursor:
+        # cursor points at the last member on the previous page
+        try:
+            after_created_at, after_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    members = await get_all_members(limit, after_created_at, after_id)
+    next_cursor = None
+    if len(members) == limit:
+        last = members[-1]
+        next_cursor = encode_cursor(last["created_at"], last["id"])
+    return json_response({"members": members, "next_cursor": next_cursor})
+
+
+@app.get("/members/export")
+async def api_export_members():
+    return await stream_json_response(stream_members())
+
+
+@app.get("/members/search")
+async def api_search_members(q: str, limit: int = Query(20, ge=1, le=200)):
+    return json_response(await search_members_by_name(q, limit))
 
 
 @app.get("/members/by-name/{name}")
-def api_get_member_id(name: str):
-    return {"id": get_member_id_by_name(name)}
+async def api_get_member_id(name: str):
+    return {"id": await get_member_id_by_name(name)}
 
 
 @app.post("/members")
-def api_add_member(member: MemberCreate):
-    return create_member(member.name, member.membership_level, member.interview_status)
+async def api_add_member(member: MemberCreate):
+    try:
+        return await create_member(member.name, member.membership_level, member.interview_status)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.delete("/members/{member_id}")
-def api_delete_member(member_id: str):
-    delete_member(member_id)
+async def api_delete_member(member_id: UUID):
+    if not await delete_member(member_id):
+        raise HTTPException(status_code=404, detail="Member not found")
     return {"status": "deleted"}
 
+
+@app.post("/offerings/bulk")
+async def api_add_offerings_bulk(offerings: list[OfferingCreate]):
+    if not offerings:
+        return []
+    if len(offerings) > MAX_BULK_OFFERINGS:
+        raise HTTPException(status_code=413,
+                            detail=f"At most {MAX_BULK_OFFERINGS} offerings per request")
+    try:
+        return json_response(await add_offerings_bulk(
+            [(o.member_id, o.amount, o.note, o.donated_at) for o in offerings]))
+    except errors.ForeignKeyViolation as e:
+        # The whole batch is rolled back
+        raise HTTPException(status_code=400, detail=e.diag.message_detail or "Unknown member_id")
+
+
+@app.get("/members/{member_id}/offerings")
+async def api_member_offerings(member_id: UUID,
+                               limit: int = Query(50, ge=1, le=500),
+                               offset: int = Query(0, ge=0)):
+    # Already JSON text from Postgres; pass it through untouched
+    return Response(await get_offering_summary(member_id, limit, offset),
+                    media_type="application/json")
+
+
+@app.get("/members/{member_id}/offerings/export")
+async def api_export_member_offerings(member_id: UUID):
+    return await stream_json_response(stream_offerings_for_member(member_id))
+
+
+@app.get("/members/{member_id}/offerings/total")
+async def api_member_offering_total(member_id: UUID):
+    return {"total": await get_offering_total(member_id)}
+
+
+@app.post("/admin/reload-lookups")
+async def api_reload_lookups():
+    await reload_lookups()
+    return {"membership_levels": len(LEVELS), "interview_statuses": len(STATUSES)}
@@ -0,0 +1,6 @@
+-- Let Postgres remove a member's offerings together with the member,
+-- so delete_member only needs a single DELETE.
+ALTER TABLE offerings
+  DROP CONSTRAINT offerings_member_id_fkey,
+  ADD CONSTRAINT offerings_member_id_fkey
+    FOREIGN KEY (member_id) REFERENCES members(id) ON DELETE CASCADE;
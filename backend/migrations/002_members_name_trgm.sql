@@ -0,0 +1,4 @@
+-- Trigram index so name ILIKE '%term%' (search_members_by_name) can use an
+-- index instead of scanning the whole members table.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS members_name_trgm ON members USING gin (name gin_trgm_ops);
@@ -0,0 +1,38 @@
+# Manual smoke check against the database in DATABASE_URL.
+# Run from the backend directory: python smoke.py
+# Note: this inserts a member, so don't point it at production.
+import asyncio
+import sys
+from app import (open_pool, close_pool, get_all_members, get_member_id_by_name,
+                 create_member)
+
+
+async def main():
+    await open_pool()
+    try:
+        print("Members:", await get_all_members())  # testing get all
+        print("ID: ", await get_member_id_by_name("王小明"))  # testing search funciton
+        # await delete_member("8552b3f4-c2fd-4af4-b7c9-cd9fb197c079") # testing delete which will
+        # testing the create
+        member_id, member_name, level_id, status_id = await create_member(
+            name="王明",
+            level_code="participant",
+            status_code="undecided",
+            gender="M",
+            phone="555-1234",
+            basic_info={"city": "Bellevue"}
+        )
+        print("Created:", member_id, member_name, level_id, status_id)
+        # Test donation (replace with a real UUID from your members table)
+        # offering = await add_offering("8bc9f775-a66a-47ea-bfdf-13fa3373a125", 1000, "測試奉獻")
+        # print("Added offering:", offering)
+        # print("Offerings:", await get_offering_summary("8bc9f775-a66a-47ea-bfdf-13fa3373a125"))
+    finally:
+        await close_pool()
+
+
+if __name__ == "__main__":
+    # psycopg's async connections can't run on Windows' default ProactorEventLoop
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(main())